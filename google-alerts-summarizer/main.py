@@ -13,14 +13,23 @@ Sorties:
   output/all_articles.md (historique complet sous forme de markdown)
 """
 
-import os, re, sys, json, logging, hashlib, time
+import os, re, sys, json, logging, hashlib, threading, time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import groupby
 from datetime import datetime, timezone, date
+from email.utils import parsedate_to_datetime
 from urllib.parse import urlparse, parse_qs, unquote
-from collections import defaultdict
 
 import feedparser
+import requests
 import trafilatura
+from trafilatura.settings import use_config
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from sumy.parsers.plaintext import PlaintextParser
 from sumy.nlp.tokenizers import Tokenizer
@@ -28,6 +37,20 @@ from sumy.summarizers.text_rank import TextRankSummarizer
 from sumy.nlp.stemmers import Stemmer
 from sumy.utils import get_stop_words
 
+# summa : TextRank vectorisé (NumPy/SciPy), bien plus rapide que sumy sur
+# les articles longs ; optionnel, sumy reste le repli.
+try:
+    from summa.summarizer import summarize as _summa_summarize
+except Exception:
+    _summa_summarize = None
+
+# orjson : encodeur/décodeur JSON en C (~5-10x plus rapide que json) ;
+# optionnel, la stdlib reste le repli. Les fichiers restent du JSON UTF-8.
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 # --- bootstrap NLTK data (français) ---
 try:
     import nltk
@@ -43,6 +66,45 @@ except Exception:
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 LANGUAGE = "french"
 
+# Motifs compilés une seule fois (utilisés des milliers de fois par run)
+_RE_WS = re.compile(r"\s+")
+_RE_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Session HTTP partagée : keep-alive + pool de connexions, évite de repayer
+# le handshake TCP/TLS à chaque article.
+_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                   "AppleWebKit/537.36 (KHTML, like Gecko) "
+                   "Chrome/124.0 Safari/537.36"),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# Config trafilatura précalculée (évite de recharger les réglages par article).
+# EXTRACTION_TIMEOUT=0 : le timeout de trafilatura repose sur signal, qui ne
+# fonctionne pas dans les threads du pool de fetch ; le timeout HTTP suffit.
+_TRAFILATURA_CFG = use_config()
+_TRAFILATURA_CFG.set("DEFAULT", "EXTRACTION_TIMEOUT", "0")
+_TRAFILATURA_CFG.set("DEFAULT", "MIN_OUTPUT_SIZE", "200")
+
+# Au-delà de cette taille de HTML, on renonce à l'extraction (pages anormales)
+_MAX_HTML_BYTES = 2_000_000
+
+# Objets sumy réutilisés : tokenizer, stemmer, stop-words et summarizer sont
+# de la configuration sans état, inutile de les reconstruire à chaque article.
+# Le verrou protège le summarizer si on résume depuis plusieurs threads.
+_TOKENIZER = Tokenizer(LANGUAGE)
+_STEMMER = Stemmer(LANGUAGE)
+_SUMMARIZER = TextRankSummarizer(_STEMMER)
+_SUMMARIZER.stop_words = frozenset(get_stop_words(LANGUAGE))
+_SUMMARIZER_LOCK = threading.Lock()
+
 # ---------- utils ----------
 def get_env_list(name: str):
     raw = os.getenv(name, "").strip()
@@ -53,6 +115,7 @@ def get_env_list(name: str):
         parts += [p.strip() for p in chunk.split(",") if p.strip()]
     return parts
 
+@lru_cache(maxsize=4096)
 def extract_original_url(url: str) -> str:
     try:
         p = urlparse(url)
@@ -67,6 +130,7 @@ def extract_original_url(url: str) -> str:
     except Exception:
         return url
 
+@lru_cache(maxsize=4096)
 def domain_of(url: str) -> str:
     try:
         return urlparse(url).netloc.replace("www.", "")
@@ -74,7 +138,7 @@ def domain_of(url: str) -> str:
         return ""
 
 def hash_id(s: str) -> str:
-    return hashlib.sha1(s.encode("utf-8")).hexdigest()[:10]
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=5).hexdigest()
 
 def dt_to_iso(d: datetime | date | None) -> str:
     if not d: return ""
@@ -84,12 +148,24 @@ def dt_to_iso(d: datetime | date | None) -> str:
 def html_to_text(html: str) -> str:
     if not html:
         return ""
+    # Beaucoup de champs summary sont du texte brut : sans balise, inutile
+    # d'instancier un parseur
+    if "<" not in html:
+        return _RE_WS.sub(" ", html).strip()
+    # Chemin rapide : parseur C de lxml + text_content(), sans marche d'arbre
+    try:
+        doc = lxml_html.fromstring(html)
+        etree.strip_elements(doc, "script", "style", "noscript", with_tail=False)
+        return _RE_WS.sub(" ", doc.text_content()).strip()
+    except Exception:
+        pass
+    # Repli : BeautifulSoup (plus tolérant sur le HTML cassé)
     try:
         soup = BeautifulSoup(html, "html.parser")
         for tag in soup(["script", "style", "noscript"]):
             tag.decompose()
         text = soup.get_text(separator=" ", strip=True)
-        return re.sub(r"\s+", " ", text).strip()
+        return _RE_WS.sub(" ", text).strip()
     except Exception:
         return ""
 
@@ -101,19 +177,13 @@ def fetch_text(url: str, timeout: int = 20) -> str:
         downloaded = None
     if not downloaded:
         try:
-            import requests
-            headers = {
-                "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                               "AppleWebKit/537.36 (KHTML, like Gecko) "
-                               "Chrome/124.0 Safari/537.36"),
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
-            }
-            r = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+            r = _SESSION.get(url, timeout=timeout, allow_redirects=True, stream=False)
             r.raise_for_status()
             downloaded = r.text
         except Exception:
             return ""
+    if len(downloaded) > _MAX_HTML_BYTES:
+        return ""
     text = trafilatura.extract(
         downloaded,
         include_tables=False,
@@ -123,59 +193,147 @@ def fetch_text(url: str, timeout: int = 20) -> str:
         no_fallback=True,
         url=url,
         output_format="txt",
+        config=_TRAFILATURA_CFG,
     )
     return text or ""
 
 def summarize_text(text: str, sentences: int = 4) -> str:
     if not text:
         return ""
-    parser = PlaintextParser.from_string(text, Tokenizer(LANGUAGE))
-    stemmer = Stemmer(LANGUAGE)
-    summarizer = TextRankSummarizer(stemmer)
-    summarizer.stop_words = get_stop_words(LANGUAGE)
+    sents = []
+    if _summa_summarize is not None:
+        try:
+            sents = _summa_summarize(text, words=sentences * 25, language=LANGUAGE, split=True)
+        except Exception:
+            sents = []
+    if len(sents) < sentences:
+        # repli sumy (texte trop court pour summa, ou summa absent)
+        parser = PlaintextParser.from_string(text, _TOKENIZER)
+        try:
+            with _SUMMARIZER_LOCK:
+                sents = [str(s) for s in _SUMMARIZER(parser.document, sentences)]
+        except Exception:
+            sents = [str(s) for s in parser.document.sentences[:sentences]]
+    sents = sents[:sentences]
+    sents = [_RE_WS.sub(" ", s).strip(" .") for s in sents if s.strip()]
+    return "\n".join(f"- {s}." for s in sents) if sents else ""
+
+def _summarize_worker(args: tuple[str, int]) -> str:
+    """Résume dans un processus fils (TextRank est du pur Python CPU-bound :
+    seuls des processus contournent le GIL)."""
+    text, sentences = args
     try:
-        sents = [str(s) for s in summarizer(parser.document, sentences)]
+        return summarize_text(text, sentences=sentences)
     except Exception:
-        sents = [str(s) for s in parser.document.sentences[:sentences]]
-    sents = [re.sub(r"\s+", " ", s).strip(" .") for s in sents if s.strip()]
-    return "\n".join(f"- {s}." for s in sents) if sents else ""
+        return ""
 
 # ---------- persistance ----------
+def _load_json(path: str):
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+def _dump_json(path: str, obj):
+    # Écriture atomique : tmp + rename, pour ne jamais laisser un JSON
+    # tronqué si le run est interrompu en pleine écriture.
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    tmp = path + ".tmp"
+    with open(tmp, "wb", buffering=1 << 20) as f:
+        f.write(data)
+    os.replace(tmp, path)
+
 def load_seen(path: str) -> set:
     if os.path.exists(path):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return set(json.load(f))
+            return set(_load_json(path))
         except Exception:
             return set()
     return set()
 
 def save_seen(path: str, seen: set):
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(sorted(list(seen)), f, ensure_ascii=False, indent=2)
+        _dump_json(path, sorted(list(seen)))
     except Exception:
         pass
 
-def load_history(hist_path: str) -> list[dict]:
+def load_history(hist_path: str) -> dict[str, dict]:
+    """Historique indexé par id : la dédup est garantie par la clé.
+       Les ids sont recalculés depuis link au chargement, ce qui migre les
+       anciens ids (sha1) vers le schéma courant sans créer de doublons."""
     if os.path.exists(hist_path):
         try:
-            with open(hist_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data if isinstance(data, list) else []
+            data = _load_json(hist_path)
+            if isinstance(data, list):
+                out: dict[str, dict] = {}
+                for a in data:
+                    if not (isinstance(a, dict) and a.get("id")):
+                        continue
+                    if a.get("link"):
+                        a["id"] = hash_id(a["link"])
+                    out[a["id"]] = a
+                return out
         except Exception:
             pass
-    return []
+    return {}
 
 def save_history(hist_path: str, items: list[dict]):
     try:
-        with open(hist_path, "w", encoding="utf-8") as f:
-            json.dump(items, f, ensure_ascii=False, indent=2)
+        _dump_json(hist_path, items)
+    except Exception:
+        pass
+
+def load_feed_meta(path: str) -> dict:
+    """etag/modified par flux, pour les GET conditionnels (304 Not Modified)."""
+    if os.path.exists(path):
+        try:
+            data = _load_json(path)
+            if isinstance(data, dict):
+                return data
+        except Exception:
+            pass
+    return {}
+
+def save_feed_meta(path: str, meta: dict):
+    try:
+        _dump_json(path, meta)
     except Exception:
         pass
 
+def load_summary_cache(path: str) -> dict:
+    """Cache hash(texte) -> résumé : évite de repasser TextRank sur un texte déjà vu."""
+    if os.path.exists(path):
+        try:
+            data = _load_json(path)
+            if isinstance(data, dict):
+                return data
+        except Exception:
+            pass
+    return {}
+
+def save_summary_cache(path: str, cache: dict):
+    try:
+        _dump_json(path, cache)
+    except Exception:
+        pass
+
+def summary_cache_key(text: str, sentences: int) -> str:
+    return hashlib.blake2b(f"{sentences}:{text}".encode("utf-8"), digest_size=16).hexdigest()
+
 # ---------- dates RSS ----------
 def parse_pub_date(entry) -> str:
+    # 0) chemin rapide : la plupart des flux datent en RFC 2822, que
+    #    parsedate_to_datetime lit directement sans passer par struct_time
+    raw = entry.get("published") or entry.get("updated") or entry.get("created")
+    if raw:
+        try:
+            return parsedate_to_datetime(raw).astimezone().date().isoformat()
+        except Exception:
+            pass
     # 1) champs parsés
     for key in ("published_parsed", "updated_parsed", "created_parsed"):
         t = entry.get(key)
@@ -197,10 +355,22 @@ def parse_pub_date(entry) -> str:
     return ""
 
 # ---------- rendu markdown ----------
+def day_of(a: dict) -> str:
+    """Jour de classement d'un article : pub_date, sinon added_on, sinon aujourd'hui."""
+    d = (a.get("pub_date") or "").strip()
+    if not _RE_ISO_DATE.match(d):
+        d = (a.get("added_on") or "").strip()[:10]
+        if not _RE_ISO_DATE.match(d):
+            d = datetime.now(timezone.utc).astimezone().date().isoformat()
+    return d
+
+
 def render_markdown(day_iso: str, articles: list[dict]) -> str:
     header = f"# Résumés – {day_iso}\n\n"
     if not articles:
         return header + "_Aucun article._\n"
+    # Séparateurs inclus dans chaque bloc : un seul "".join, pas de repasse
+    # d'insertion (sortie identique à l'ancien "\n".join)
     parts = [header]
     for r in articles:
         title = r.get("title", "(Sans titre)")
@@ -209,8 +379,17 @@ def render_markdown(day_iso: str, articles: list[dict]) -> str:
         pub = r.get("pub_date", "")
         meta = " | ".join([p for p in (f"Source : {source}" if source else "", f"Publication : {pub}" if pub else "") if p])
         meta_line = f"*{meta}*" if meta else ""
-        parts.append(f"## [{title}]({link})  \n{meta_line}\n\n{r.get('summary','')}\n")
-    return "\n".join(parts)
+        parts.append(f"\n## [{title}]({link})  \n{meta_line}\n\n{r.get('summary','')}\n")
+    return "".join(parts)
+
+# ---------- flux RSS ----------
+def _fetch_feed(url: str, meta: dict | None = None):
+    """Télécharge et parse un flux (exécuté dans le pool de threads).
+       meta = {"etag", "modified"} du run précédent -> le serveur répond
+       304 Not Modified si le flux n'a pas bougé et feedparser court-circuite."""
+    logging.info(f"Lecture du flux: {url}")
+    meta = meta or {}
+    return url, feedparser.parse(url, etag=meta.get("etag"), modified=meta.get("modified"))
 
 # ---------- programme ----------
 def main():
@@ -227,26 +406,51 @@ def main():
     history_path = os.path.join(out_dir, "all_articles.json")
     md_all_path = os.path.join(out_dir, "all_articles.md")
     latest_path = os.path.join(out_dir, "latest.md")
+    summary_cache_path = os.path.join(out_dir, "summary_cache.json")
+
+    feed_meta_path = os.path.join(out_dir, "feed_meta.json")
 
     seen = load_seen(seen_path)
     history = load_history(history_path)
+    summary_cache = load_summary_cache(summary_cache_path)
+    feed_meta = load_feed_meta(feed_meta_path)
+
+    # load_history a recalculé les ids depuis link : on aligne seen sur ces
+    # ids pour ne pas retraiter (ni dupliquer) les articles déjà connus
+    seen |= set(history.keys())
 
     # ----- MODE RENDER_ONLY : (re)générer les fichiers depuis l'historique -----
     if render_only:
-        return render_from_history(history, out_dir, md_all_path, latest_path)
+        return render_from_history(list(history.values()), out_dir, md_all_path, latest_path)
 
     if not feeds:
         logging.error("Aucun flux RSS spécifié. Définissez FEEDS.")
         sys.exit(1)
 
     # ----- Collecte / enrichissement historique -----
+    # Les flux sont téléchargés en parallèle (I/O réseau) ; le traitement des
+    # entrées reste sur le thread principal pour préserver seen/dédup.
+    # GET conditionnels : etag/modified du run précédent (ignorés en FORCE_ALL
+    # pour vraiment tout retraiter)
+    feed_workers = int(os.getenv("FEED_WORKERS", "8"))
     items = []
-    for feed_url in feeds:
-        logging.info(f"Lecture du flux: {feed_url}")
-        fp = feedparser.parse(feed_url)
+    with ThreadPoolExecutor(max_workers=feed_workers) as executor:
+        parsed_feeds = list(executor.map(
+            lambda u: _fetch_feed(u, None if force_all else feed_meta.get(u)), feeds))
+    for feed_url, fp in parsed_feeds:
+        if getattr(fp, "status", None) == 304:
+            logging.info(f"Flux inchangé (304): {feed_url}")
+            continue
         if fp.bozo and not fp.entries:
             logging.warning(f"Flux invalide ou inaccessible: {feed_url}")
             continue
+        meta = {}
+        if getattr(fp, "etag", None):
+            meta["etag"] = fp.etag
+        if getattr(fp, "modified", None):
+            meta["modified"] = fp.modified
+        if meta:
+            feed_meta[feed_url] = meta
         for entry in fp.entries[:max_per_feed]:
             title = entry.get("title", "").strip()
             link = entry.get("link", "").strip()
@@ -282,20 +486,70 @@ def main():
 
     logging.info(f"{len(items)} nouvel(le)s article(s) à traiter.")
 
-    # Résumer + mise à jour de l'historique (mais PAS d'écriture du jour ici)
+    # Étape A : téléchargement du texte des articles en parallèle (I/O réseau).
+    # Quand le flux fournit déjà un hint assez long, on s'épargne le fetch
+    # (c'est l'étape la plus chère) : le résumé se fera sur le hint.
+    fetch_workers = int(os.getenv("FETCH_WORKERS", "16"))
+    hint_min_chars = int(os.getenv("HINT_MIN_CHARS", "1200"))
+    to_fetch = [it for it in items if len(it.get("hint", "")) < hint_min_chars]
+    texts: dict[str, str] = {}
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+            futures = {executor.submit(fetch_text, it["link"], timeout=timeout): it["uid"]
+                       for it in to_fetch}
+            for fut in as_completed(futures):
+                try:
+                    texts[futures[fut]] = fut.result()
+                except Exception:
+                    texts[futures[fut]] = ""
+
+    # Étape B : précalculer les résumés manquants dans un pool de processus
+    # (TextRank est CPU-bound, le GIL sérialise les threads) ; les résultats
+    # alimentent summary_cache, le reste de la boucle y trouve ses résumés.
+    summary_workers = int(os.getenv("SUMMARY_WORKERS", str(os.cpu_count() or 1)))
+    pending: dict[str, str] = {}  # cache_key -> texte (dédupliqué)
+    for it in items:
+        base_text = texts.get(it["uid"], "") or it.get("hint", "") or it["title"]
+        if not base_text:
+            continue
+        key = summary_cache_key(base_text, sentences)
+        if key not in summary_cache:
+            pending[key] = base_text
+    if summary_workers > 1 and len(pending) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=summary_workers) as pe:
+                results = list(pe.map(_summarize_worker,
+                                      [(t, sentences) for t in pending.values()]))
+            for key, summary in zip(pending.keys(), results):
+                if summary:
+                    summary_cache[key] = summary
+        except Exception as e:
+            # repli : la boucle ci-dessous résumera en séquentiel
+            logging.warning(f"Pool de résumé indisponible, passage en séquentiel ({e})")
+
+    # Étape C : résumer + mise à jour de l'historique sur le thread principal
+    # (mais PAS d'écriture du jour ici)
+    changed_days: set[str] = set()
     for it in items:
         url = it["link"]
         title = it["title"]
         hint = it.get("hint", "")
         try:
-            full = fetch_text(url, timeout=timeout)
+            full = texts.get(it["uid"], "")
             base_text = full or hint or title
-            summary = summarize_text(base_text, sentences=sentences) if base_text else ""
+            summary = ""
+            if base_text:
+                cache_key = summary_cache_key(base_text, sentences)
+                summary = summary_cache.get(cache_key, "")
+                if not summary:
+                    summary = summarize_text(base_text, sentences=sentences)
+                    if summary:
+                        summary_cache[cache_key] = summary
             if not summary:
                 summary = "- (Résumé indisponible – texte non détecté)."
 
             seen.add(it["uid"])
-            history.append({
+            entry = {
                 "id": it["uid"],
                 "title": it["title"],
                 "link": it["link"],
@@ -303,42 +557,45 @@ def main():
                 "pub_date": it.get("pub_date",""),
                 "summary": summary,
                 "added_on": dt_to_iso(datetime.now().astimezone()),
-            })
+            }
+            history[entry["id"]] = entry
+            changed_days.add(day_of(entry))
             logging.info(f"OK: {title} [{it.get('source','')}]")
         except Exception as e:
             logging.warning(f"Echec: {title} ({url}) -> {e}")
 
-    # ----- Dédup + tri de l'historique puis rendu complet -----
-    dedup = {}
-    for a in history:
-        if isinstance(a, dict) and a.get("id"):
-            dedup[a["id"]] = a
-    hist = list(dedup.values())
-    # tri par (pub_date, added_on) décroissant
-    hist.sort(key=lambda a: (a.get("pub_date",""), a.get("added_on","")), reverse=True)
+    # ----- Tri de l'historique puis rendu complet (dédup assurée par la clé id) -----
+    # tri par (pub_date, added_on) décroissant ; clés précalculées une fois
+    # (Schwartzian transform) au lieu de deux .get par comparaison
+    decorated = [((a.get("pub_date", ""), a.get("added_on", "")), a) for a in history.values()]
+    decorated.sort(key=lambda t: t[0], reverse=True)
+    hist = [a for _, a in decorated]
 
     save_seen(seen_path, seen)
     save_history(history_path, hist)
+    save_summary_cache(summary_cache_path, summary_cache)
+    save_feed_meta(feed_meta_path, feed_meta)
 
-    # (ré)générer toutes les sorties depuis l'historique
-    render_from_history(hist, out_dir, md_all_path, latest_path)
+    # (ré)générer les sorties depuis l'historique (tout si FORCE_ALL,
+    # sinon seulement les jours touchés par ce run)
+    render_from_history(hist, out_dir, md_all_path, latest_path,
+                        changed_days=None if force_all else changed_days)
 
 
-def render_from_history(history: list[dict], out_dir: str, md_all_path: str, latest_path: str):
+def render_from_history(history: list[dict], out_dir: str, md_all_path: str, latest_path: str,
+                        changed_days: set[str] | None = None):
     """Reconstruit output/*.md + latest.md + all_articles.md depuis l'historique.
        -> Empêche qu'un run vide efface les sorties.
+       changed_days: si fourni, seuls ces jours sont réécrits (les autres
+       fichiers existants sont laissés tels quels) ; None = tout réécrire.
     """
-    # 1) Grouper par jour de publication (repli: added_on)
-    by_day: dict[str, list[dict]] = defaultdict(list)
-    for a in history:
-        d = (a.get("pub_date") or "").strip()
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", d or ""):
-            d = (a.get("added_on") or "").strip()[:10]
-            if not re.match(r"^\d{4}-\d{2}-\d{2}$", d or ""):
-                d = datetime.now(timezone.utc).astimezone().date().isoformat()
-        by_day[d].append(a)
-
-    if not by_day:
+    # 1) Trier par jour de publication (repli: added_on) puis grouper en une
+    #    passe ; la clé est calculée une seule fois par article et le tri
+    #    stable conserve l'ordre (pub_date, added_on) à l'intérieur d'un jour.
+    decorated = [(day_of(a), a) for a in history]
+    decorated.sort(key=lambda t: t[0])
+
+    if not decorated:
         # rien dans l'historique -> vider prudemment latest.md
         with open(md_all_path, "w", encoding="utf-8") as f:
             f.write("# Historique (vide)\n\n")
@@ -346,30 +603,53 @@ def render_from_history(history: list[dict], out_dir: str, md_all_path: str, lat
         print("Historique vide. Sorties minimales générées.")
         return
 
-    # 2) Écrire un fichier output/<day>.md par jour
+    # 2) Écrire un fichier output/<day>.md par jour (seulement ceux qui changent)
     os.makedirs(out_dir, exist_ok=True)
-    days_sorted = sorted(by_day.keys())
-    for day in days_sorted:
+    day_groups = [(day, [a for _, a in group])
+                  for day, group in groupby(decorated, key=lambda t: t[0])]
+    days_sorted = [day for day, _ in day_groups]
+    written = []
+    for day, articles in day_groups:
         md_path = os.path.join(out_dir, f"{day}.md")
-        md_text = render_markdown(day, by_day[day])
+        if changed_days is not None and day not in changed_days and os.path.exists(md_path):
+            continue
+        md_text = render_markdown(day, articles)
         with open(md_path, "w", encoding="utf-8") as f:
             f.write(md_text)
+        written.append(day)
 
-    # 3) latest.md = jour le plus récent
-    latest_day = max(days_sorted)
+    # 3) latest.md = jour le plus récent (dernier groupe, ordre croissant)
+    latest_day, latest_articles = day_groups[-1]
     with open(latest_path, "w", encoding="utf-8") as f:
-        f.write(render_markdown(latest_day, by_day[latest_day]))
+        f.write(render_markdown(latest_day, latest_articles))
 
     # 4) all_articles.md (historique complet)
     #    On réutilise le même rendu en mettant 'latest_day' comme entête.
+    #    Empreinte des ids dans output/.render_cache pour sauter la réécriture
+    #    quand l'historique n'a pas bougé.
     flat = []
-    for d in sorted(by_day.keys(), reverse=True):
-        flat.extend(by_day[d])
-    with open(md_all_path, "w", encoding="utf-8") as f:
-        f.write(render_markdown(latest_day, flat))
+    for _, articles in reversed(day_groups):
+        flat.extend(articles)
+    digest = hashlib.blake2b(
+        "\n".join(f"{a.get('id', '')}|{a.get('added_on', '')}|{a.get('summary', '')}" for a in flat)
+        .encode("utf-8")).hexdigest()
+    cache_path = os.path.join(out_dir, ".render_cache")
+    prev_digest = ""
+    if changed_days is not None:
+        # en réécriture totale (None), on n'applique pas le cache : on réécrit
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                prev_digest = f.read().strip()
+        except OSError:
+            pass
+    if changed_days is None or digest != prev_digest or not os.path.exists(md_all_path):
+        with open(md_all_path, "w", encoding="utf-8") as f:
+            f.write(render_markdown(latest_day, flat))
+        with open(cache_path, "w", encoding="utf-8") as f:
+            f.write(digest)
 
     print(
-        f"Jours générés: {', '.join(days_sorted)} | Dernier: {latest_day}\n"
+        f"Jours générés: {', '.join(written) or '(aucun)'} | Dernier: {latest_day}\n"
         f"Écrit: output/<day>.md, output/latest.md, output/all_articles.md"
     )
 